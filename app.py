@@ -1,15 +1,11 @@
 import pandas as pd
 import os, sys
 
-import requests, io
-import pyarrow as pa
-import pyarrow.feather as feather
-
 import dash
 import dash_core_components as dcc
 import dash_html_components as html
 import plotly.graph_objects as go # graph objects
-import plotly.express as px
+from plotly.colors import qualitative   # palette only: avoids loading plotly.express at boot
 
 # imports for dash construction
 import pydecovid
@@ -50,13 +46,17 @@ fig_gender = go.Figure()
 
 fig_age.add_trace(
     go.Bar(
-        x = df_age.stratum_1, y = df_age.count_value, marker_color=px.colors.qualitative.T10[0])   #, name='SF'),
+        x = df_age.stratum_1, y = df_age.count_value, marker_color=qualitative.T10[0])   #, name='SF'),
 )
 
 
-cols_T10_permute = [px.colors.qualitative.T10[i] for i in [3,1,0,2,4,5,6,7,8,9]]
-fig_gender = px.pie(df_gender, values='count_value', names='stratum_1', color='stratum_1',
-             color_discrete_sequence=cols_T10_permute, hole=0.3)
+cols_T10_permute = [qualitative.T10[i] for i in [3,1,0,2,4,5,6,7,8,9]]
+fig_gender.add_trace(
+    go.Pie(
+        labels = df_gender.stratum_1, values = df_gender.count_value, hole=0.3,
+        marker_colors=[cols_T10_permute[i % 10] for i in range(df_gender.shape[0])],
+        hovertemplate='stratum_1=%{label}<br>count_value=%{value}<extra></extra>')
+)
 # fig_gender.add_trace(
 #     go.Bar(
 #         x = df_gender.stratum_1, y = df_gender.count_value)
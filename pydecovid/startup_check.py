@@ -0,0 +1,48 @@
+import os, sys
+import subprocess
+import fire
+
+# Modules which should *not* be pulled in when the web process boots. They are
+# either unused by the dashboard, or only required by the offline build step
+# (`achilles_process.py`). `pyarrow` (incl. `pyarrow.feather`) is not listed: it
+# is imported by pandas inside `pd.read_feather` when `app.py` loads its data.
+heavy_modules = ['plotly.express', 'requests', 'sqlalchemy', 'fire']
+
+# Run in a fresh interpreter so nothing is already cached in `sys.modules`.
+_timing_script = '''
+import sys, time
+t0 = time.perf_counter()
+import {module:s}
+elapsed = time.perf_counter() - t0
+print(elapsed, *[m for m in {heavy!r} if m in sys.modules])
+'''
+
+
+def time_startup(module='app', cwd='.'):
+    script = _timing_script.format(module=module, heavy=heavy_modules)
+    out = subprocess.run([sys.executable, '-c', script], cwd=cwd,
+                         stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    fields = out.stdout.strip().split('\n')[-1].split()
+    return float(fields[0]), fields[1:]
+
+
+def check_startup(budget=3.0, module='app', cwd='.', repeats=3, verbose=True):
+    """
+    Import the web process entry point `module` in a fresh interpreter and fail
+    (non-zero exit) if the fastest of `repeats` boots exceeds `budget` seconds,
+    or if any of `heavy_modules` were imported along the way.
+    """
+    results = [time_startup(module=module, cwd=cwd) for _ in range(repeats)]
+    elapsed = min(r[0] for r in results)
+    loaded = results[0][1]
+    verbose and print(f'Import of `{module:s}`: {elapsed:.2f}s (budget {budget:.2f}s).')
+
+    if len(loaded) > 0:
+        raise RuntimeError('Heavy modules imported at web startup: {:s}.'.format(', '.join(loaded)))
+    if elapsed > budget:
+        raise RuntimeError(f'Web process startup took {elapsed:.2f}s, over the {budget:.2f}s budget.')
+    verbose and print('Success.')
+
+
+if __name__ == '__main__':
+    fire.Fire(check_startup)